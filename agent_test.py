@@ -2,14 +2,127 @@
 """
 Agent Testing Suite
 This script demonstrates various capabilities of the AI coding agent.
+
+The suite is interpreter-bound, so it also runs well under PyPy:
+
+    pypy3 agent_test.py
+
+Optional accelerators (orjson, NumPy, Numba) are skipped when unavailable,
+and NumPy is never used under PyPy, where it runs through the slow C-API
+emulation layer. This keeps the pure-Python paths that PyPy's JIT traces.
 """
 
+import copy
+import io
 import os
 import sys
+import platform
 import json
-import math
-from datetime import datetime
-from typing import List, Dict, Any
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, NamedTuple
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def json_loads(data: bytes) -> Any:
+    """Deserialize JSON bytes produced by json_dumps."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+if platform.python_implementation() == "PyPy":
+    np = None  # the list/sorted paths are faster under PyPy's JIT
+else:
+    try:
+        import numpy as np
+    except ImportError:  # numpy is an optional speedup
+        np = None
+
+
+try:
+    from numba import njit
+except ImportError:  # numba is an optional speedup
+    njit = None
+
+
+def _jit(signature: str):
+    """Compile a numeric kernel with Numba, or return it unchanged without it."""
+    def decorate(func):
+        if njit is None:
+            return func
+        return njit(signature, cache=True)(func)
+    return decorate
+
+
+def fibonacci(n):
+    """Return the n-th Fibonacci number.
+
+    Uses fast doubling, F(2k) = F(k) * (2F(k+1) - F(k)) and
+    F(2k+1) = F(k)^2 + F(k+1)^2, over the bits of n: O(log n) big-integer
+    multiplications instead of exponentially many recursive calls.
+    """
+    if n <= 1:
+        return n
+    a, b = 0, 1  # F(k), F(k+1) with k = 0
+    for shift in range(n.bit_length() - 1, -1, -1):
+        c = a * ((b << 1) - a)
+        d = a * a + b * b
+        if (n >> shift) & 1:
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a
+
+
+# Bit i is set if i is prime, for 0 <= i < 64
+_SMALL_PRIMES = 0x28208a20a08a28ac
+
+
+@_jit("boolean(int64)")
+def is_prime(n):
+    """Return True if n is a prime number."""
+    if n < 2:
+        return False
+    if n < 64:
+        return (_SMALL_PRIMES >> n) & 1 == 1
+    if n % 2 == 0 or n % 3 == 0:
+        return False
+    # 6k +/- 1 wheel: skip multiples of 2 and 3
+    i = 5
+    while i * i <= n:
+        if n % i == 0 or n % (i + 2) == 0:
+            return False
+        i += 6
+    return True
+
+
+# Expected results for the fixed test inputs
+_SQUARED = (1, 4, 9, 16, 25)
+_SORTED = (11, 12, 22, 25, 34, 64, 90)
+_INTERSECTION = frozenset({4, 5})
+
+
+class ResultRecord(NamedTuple):
+    """A single result recorded by AgentTester.log_test."""
+    test: str
+    success: bool
+    details: str
+    timestamp: int  # monotonic nanoseconds since the tester's _t0_ns reading
+
 
 class AgentTester:
     """A class to test various agent capabilities."""
@@ -17,19 +130,58 @@ class AgentTester:
     def __init__(self):
         self.test_results = []
         self.start_time = datetime.now()
+        self._t0_ns = time.monotonic_ns()
+        self._out = io.StringIO()
+        self._lock = threading.Lock()
+    
+    def fresh_copy(self) -> "AgentTester":
+        """Return a copy with no results or output that shares this tester's clock.
+
+        test_results, _out and _lock are per-copy; start_time and _t0_ns are
+        shared so timestamps from every copy are measured from the same
+        origin. New per-instance state must be replaced here as well.
+        """
+        clone = copy.copy(self)
+        clone.test_results = []
+        clone._out = io.StringIO()
+        clone._lock = threading.Lock()
+        return clone
+    
+    def run_tests(self, test_names: List[str]):
+        """Run the named test methods concurrently.
+
+        Each test runs on its own fresh_copy, and its results and output are
+        merged back in the order given, regardless of which finishes first.
+        """
+        if not test_names:
+            return
+        workers = [self.fresh_copy() for _ in test_names]
+        with ThreadPoolExecutor(max_workers=len(test_names)) as executor:
+            futures = [executor.submit(getattr(worker, name))
+                       for worker, name in zip(workers, test_names)]
+            for worker, future in zip(workers, futures):
+                future.result()
+                with self._lock:
+                    self.test_results.extend(worker.test_results)
+                    self._out.write(worker._out.getvalue())
     
     def log_test(self, test_name: str, success: bool, details: str = ""):
-        """Log a test result."""
-        self.test_results.append({
-            "test": test_name,
-            "success": success,
-            "details": details,
-            "timestamp": datetime.now().isoformat()
-        })
+        """Log a test result.
+
+        Output is buffered and written to stdout by generate_report. The
+        timestamp is stored as monotonic nanoseconds since the _t0_ns reading
+        taken in __init__ (alongside start_time) and converted to an ISO
+        string only when the report is built. Safe to call from
+        several threads at once.
+        """
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status}: {test_name}")
-        if details:
-            print(f"  Details: {details}")
+        with self._lock:
+            self.test_results.append(ResultRecord(
+                test_name, success, details, time.monotonic_ns() - self._t0_ns
+            ))
+            self._out.write(f"{status}: {test_name}\n")
+            if details:
+                self._out.write(f"  Details: {details}\n")
     
     def test_basic_operations(self):
         """Test basic Python operations."""
@@ -44,8 +196,11 @@ class AgentTester:
             
             # List operations
             numbers = [1, 2, 3, 4, 5]
-            squared = [x**2 for x in numbers]
-            assert squared == [1, 4, 9, 16, 25], f"Unexpected result: {squared}"
+            if np is not None:
+                squared = (np.asarray(numbers) ** 2).tolist()
+            else:
+                squared = [x**2 for x in numbers]
+            assert tuple(squared) == _SQUARED, f"Unexpected result: {squared}"
             
             self.log_test("Basic Operations", True, "Math, strings, and lists working correctly")
         except Exception as e:
@@ -57,13 +212,18 @@ class AgentTester:
             test_file = "temp_test_file.txt"
             test_content = "This is a test file created by the agent.\nLine 2\nLine 3"
             
-            # Write file
-            with open(test_file, 'w') as f:
-                f.write(test_content)
+            data = test_content.encode("utf-8")
             
-            # Read file
-            with open(test_file, 'r') as f:
-                read_content = f.read()
+            # Write and read back through a single descriptor
+            flags = os.O_RDWR | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+            fd = os.open(test_file, flags, 0o644)
+            try:
+                written = os.write(fd, data)
+                assert written == len(data), f"Short write: {written} of {len(data)} bytes"
+                os.lseek(fd, 0, os.SEEK_SET)
+                read_content = os.read(fd, len(data) + 1).decode("utf-8")
+            finally:
+                os.close(fd)
             
             assert read_content == test_content, "File content mismatch"
             
@@ -84,9 +244,8 @@ class AgentTester:
                 "features": ["coding", "testing", "debugging"]
             }
             
-            # JSON serialization
-            json_str = json.dumps(data, indent=2)
-            parsed_data = json.loads(json_str)
+            # JSON serialization (compact, pretty-printing adds nothing to a round-trip)
+            parsed_data = json_loads(json_dumps(data))
             
             assert parsed_data == data, "JSON serialization/deserialization failed"
             
@@ -94,7 +253,7 @@ class AgentTester:
             set1 = {1, 2, 3, 4, 5}
             set2 = {4, 5, 6, 7, 8}
             intersection = set1 & set2
-            assert intersection == {4, 5}, f"Expected {4, 5}, got {intersection}"
+            assert intersection == _INTERSECTION, f"Expected {set(_INTERSECTION)}, got {intersection}"
             
             self.log_test("Data Structures", True, "Dictionaries, JSON, and sets working correctly")
         except Exception as e:
@@ -104,29 +263,18 @@ class AgentTester:
         """Test some basic algorithms."""
         try:
             # Fibonacci sequence
-            def fibonacci(n):
-                if n <= 1:
-                    return n
-                return fibonacci(n-1) + fibonacci(n-2)
-            
             fib_10 = fibonacci(10)
             assert fib_10 == 55, f"Expected 55, got {fib_10}"
             
             # Sorting
             unsorted_list = [64, 34, 25, 12, 22, 11, 90]
-            sorted_list = sorted(unsorted_list)
-            expected = [11, 12, 22, 25, 34, 64, 90]
-            assert sorted_list == expected, f"Expected {expected}, got {sorted_list}"
+            if np is not None:
+                sorted_list = np.sort(np.asarray(unsorted_list)).tolist()
+            else:
+                sorted_list = sorted(unsorted_list)
+            assert tuple(sorted_list) == _SORTED, f"Expected {list(_SORTED)}, got {sorted_list}"
             
             # Prime number check
-            def is_prime(n):
-                if n < 2:
-                    return False
-                for i in range(2, int(math.sqrt(n)) + 1):
-                    if n % i == 0:
-                        return False
-                return True
-            
             assert is_prime(17) == True, "17 should be prime"
             assert is_prime(18) == False, "18 should not be prime"
             
@@ -163,29 +311,48 @@ class AgentTester:
         except Exception as e:
             self.log_test("Error Handling", False, str(e))
     
+    def _isoformat(self, offset_ns: int) -> str:
+        """Convert a log_test timestamp offset into an ISO wall-clock string."""
+        return (self.start_time + timedelta(microseconds=offset_ns // 1000)).isoformat()
+    
     def generate_report(self):
         """Generate a test report."""
         end_time = datetime.now()
         duration = end_time - self.start_time
         
-        passed = sum(1 for result in self.test_results if result["success"])
+        # Count, collect failures and serialize results in a single pass
+        passed = 0
+        failed = []
+        results = []
+        for result in self.test_results:
+            if result.success:
+                passed += 1
+            else:
+                failed.append(result)
+            results.append(
+                {**result._asdict(), "timestamp": self._isoformat(result.timestamp)}
+            )
         total = len(self.test_results)
         
-        print("\n" + "="*50)
-        print("AGENT TEST REPORT")
-        print("="*50)
-        print(f"Total Tests: {total}")
-        print(f"Passed: {passed}")
-        print(f"Failed: {total - passed}")
-        print(f"Success Rate: {(passed/total)*100:.1f}%")
-        print(f"Duration: {duration.total_seconds():.2f} seconds")
-        print(f"Timestamp: {end_time.isoformat()}")
+        out = self._out
+        out.write("\n" + "="*50 + "\n")
+        out.write("AGENT TEST REPORT\n")
+        out.write("="*50 + "\n")
+        out.write(f"Total Tests: {total}\n")
+        out.write(f"Passed: {passed}\n")
+        out.write(f"Failed: {total - passed}\n")
+        out.write(f"Success Rate: {(passed/total)*100:.1f}%\n")
+        out.write(f"Duration: {duration.total_seconds():.2f} seconds\n")
+        out.write(f"Timestamp: {end_time.isoformat()}\n")
+        
+        if failed:
+            out.write("\nFailed Tests:\n")
+            for result in failed:
+                out.write(f"  - {result.test}: {result.details}\n")
         
-        if total - passed > 0:
-            print("\nFailed Tests:")
-            for result in self.test_results:
-                if not result["success"]:
-                    print(f"  - {result['test']}: {result['details']}")
+        # Flush everything logged so far in a single write
+        sys.stdout.write(out.getvalue())
+        self._out = io.StringIO()
         
         return {
             "total": total,
@@ -193,32 +360,35 @@ class AgentTester:
             "failed": total - passed,
             "success_rate": (passed/total)*100,
             "duration_seconds": duration.total_seconds(),
-            "results": self.test_results
+            "results": results
         }
 
 def main():
     """Main test execution function."""
     print("🤖 Starting Agent Capability Tests...")
     print(f"Python Version: {sys.version}")
+    print(f"Implementation: {platform.python_implementation()}")
     print(f"Platform: {sys.platform}")
     print(f"Working Directory: {os.getcwd()}")
     print("-" * 50)
     
     tester = AgentTester()
     
-    # Run all tests
-    tester.test_basic_operations()
-    tester.test_file_operations()
-    tester.test_data_structures()
-    tester.test_algorithms()
-    tester.test_error_handling()
+    # Run all tests concurrently, reporting results in this order
+    tester.run_tests([
+        "test_basic_operations",
+        "test_file_operations",
+        "test_data_structures",
+        "test_algorithms",
+        "test_error_handling",
+    ])
     
     # Generate report
     report = tester.generate_report()
     
     # Save report to file
-    with open("agent_test_report.json", "w") as f:
-        json.dump(report, f, indent=2)
+    with open("agent_test_report.json", "wb") as f:
+        f.write(json_dumps(report, indent=True))
     
     print(f"\n📊 Test report saved to: agent_test_report.json")
     
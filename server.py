@@ -3,46 +3,213 @@
 Simple HTTP Server for Agent Test Dashboard
 """
 
+import datetime
+import email.utils
+import errno
+import gzip
 import http.server
+import io
 import socketserver
 import webbrowser
 import os
 import sys
+from http import HTTPStatus
 from pathlib import Path
+from typing import Dict, Tuple
+
+# How many consecutive ports start_server tries before giving up
+MAX_PORT_ATTEMPTS = 64
+
+# Highest valid TCP port number
+MAX_PORT = 65535
+
+# Text assets that are gzip-encoded for clients that accept it
+COMPRESSIBLE_SUFFIXES = (".html", ".js", ".css", ".json")
+
+# path -> (mtime_ns, mtime, etag, raw bytes, gzipped bytes)
+_CACHE: Dict[str, Tuple[int, float, str, bytes, bytes]] = {}
+
+def load_cached_file(path: str) -> Tuple[float, str, bytes, bytes]:
+    """Return (mtime, etag, raw, gzipped) for path, re-reading it only if it changed."""
+    st = os.stat(path)
+    entry = _CACHE.get(path)
+    if entry is None or entry[0] != st.st_mtime_ns or len(entry[3]) != st.st_size:
+        with open(path, "rb") as f:
+            raw = f.read()
+        etag = f'"{st.st_mtime_ns:x}-{len(raw):x}"'
+        entry = (st.st_mtime_ns, st.st_mtime, etag, raw,
+                 gzip.compress(raw, compresslevel=6))
+        _CACHE[path] = entry
+    return entry[1:]
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Return True if an Accept-Encoding header allows gzip with q > 0."""
+    gzip_q = None
+    any_q = None
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if coding in ("gzip", "x-gzip"):
+            gzip_q = q
+        elif coding == "*":
+            any_q = q
+    if gzip_q is None:
+        gzip_q = any_q or 0.0
+    return gzip_q > 0
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weakly compare an If-None-Match header against etag (RFC 7232)."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == opaque:
+            return True
+    return False
+
+def not_modified_since(if_modified_since: str, mtime: float) -> bool:
+    """Return True if a file modified at mtime is not newer than If-Modified-Since.
+
+    Mirrors SimpleHTTPRequestHandler.send_head: ill-formed dates and dates
+    not in UTC never match.
+    """
+    try:
+        ims = email.utils.parsedate_to_datetime(if_modified_since)
+    except (TypeError, IndexError, OverflowError, ValueError):
+        return False
+    if ims.tzinfo is None:
+        # obsolete format with no timezone, cf. RFC 7231 section 7.1.1.1
+        ims = ims.replace(tzinfo=datetime.timezone.utc)
+    if ims.tzinfo is not datetime.timezone.utc:
+        return False
+    # HTTP dates have whole-second resolution
+    last_modif = datetime.datetime.fromtimestamp(mtime, datetime.timezone.utc)
+    return last_modif.replace(microsecond=0) <= ims
 
 class CustomHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     def end_headers(self):
-        self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
+        self.send_header('Cache-Control', 'no-cache, must-revalidate')
         self.send_header('Pragma', 'no-cache')
         self.send_header('Expires', '0')
         super().end_headers()
 
+    def send_head(self):
+        """Serve text assets from the in-memory cache.
+
+        Responses carry an ETag and Last-Modified so revalidating clients
+        get a 304, and are
+        gzip-encoded when the client accepts it.
+        """
+        path = self.translate_path(self.path)
+        if not path.endswith(COMPRESSIBLE_SUFFIXES) or not os.path.isfile(path):
+            return super().send_head()
+        
+        try:
+            mtime, etag, raw, compressed = load_cached_file(path)
+        except OSError:
+            self.send_error(HTTPStatus.NOT_FOUND, "File not found")
+            return None
+        
+        use_gzip = accepts_gzip(self.headers.get("Accept-Encoding", ""))
+        if use_gzip:
+            etag = etag[:-1] + '-gzip"'
+        
+        # If-Modified-Since is only consulted without If-None-Match (RFC 7232)
+        if_none_match = self.headers.get("If-None-Match")
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if (etag_matches(if_none_match, etag) if if_none_match
+                else if_modified_since and not_modified_since(if_modified_since, mtime)):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+            return None
+        
+        body = compressed if use_gzip else raw
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-type", self.guess_type(path))
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Last-Modified", self.date_time_string(mtime))
+        self.send_header("ETag", etag)
+        self.send_header("Vary", "Accept-Encoding")
+        self.end_headers()
+        return io.BytesIO(body)
+
+    def copyfile(self, source, outputfile):
+        """Copy a file to the client with zero-copy sendfile when possible."""
+        if outputfile is self.wfile:
+            try:
+                source.fileno()
+            except (AttributeError, OSError):
+                pass
+            else:
+                # socket.sendfile uses os.sendfile and falls back to send()
+                self.connection.sendfile(source)
+                return
+        super().copyfile(source, outputfile)
+
+class DashboardHTTPServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server that serves each request on its own thread."""
+    request_queue_size = 128
+
+    def server_bind(self):
+        """Bind without the reverse DNS lookup done by HTTPServer."""
+        socketserver.TCPServer.server_bind(self)
+        host, port = self.server_address[:2]
+        self.server_name = host or "localhost"
+        self.server_port = port
+
 def start_server(port=8000):
-    """Start a simple HTTP server."""
+    """Start a simple HTTP server on the first free port from port onwards."""
     try:
         # Change to the directory containing our files
         os.chdir(Path(__file__).parent)
         
-        # Create server
-        with socketserver.TCPServer(("", port), CustomHTTPRequestHandler) as httpd:
-            print(f"🌐 Starting server at http://localhost:{port}")
-            print(f"📁 Serving files from: {os.getcwd()}")
-            print(f"🎯 Dashboard: http://localhost:{port}/dashboard.html")
-            print("Press Ctrl+C to stop the server")
-            print("-" * 50)
-            
+        # Create server, scanning upwards past ports that are in use
+        last_port = min(port + MAX_PORT_ATTEMPTS, MAX_PORT + 1) - 1
+        for candidate in range(port, last_port + 1):
             try:
-                httpd.serve_forever()
-            except KeyboardInterrupt:
-                print("\n🛑 Server stopped by user")
-                
-    except OSError as e:
-        if e.errno == 48:  # Address already in use
-            print(f"❌ Port {port} is already in use. Trying port {port + 1}")
-            start_server(port + 1)
+                httpd = DashboardHTTPServer(("", candidate), CustomHTTPRequestHandler)
+                break
+            except OSError as e:
+                if e.errno != errno.EADDRINUSE:
+                    raise
+                if candidate < last_port:
+                    print(f"❌ Port {candidate} is already in use. Trying port {candidate + 1}")
+                else:
+                    print(f"❌ Port {candidate} is already in use.")
         else:
-            print(f"❌ Error starting server: {e}")
+            print(f"❌ No free port in range {port}-{last_port}")
             sys.exit(1)
+    except OSError as e:
+        print(f"❌ Error starting server: {e}")
+        sys.exit(1)
+    
+    with httpd:
+        port = httpd.server_port
+        print(f"🌐 Starting server at http://localhost:{port}")
+        print(f"📁 Serving files from: {os.getcwd()}")
+        print(f"🎯 Dashboard: http://localhost:{port}/dashboard.html")
+        print("Press Ctrl+C to stop the server")
+        print("-" * 50)
+        
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            print("\n🛑 Server stopped by user")
 
 if __name__ == "__main__":
     start_server()
\ No newline at end of file
@@ -7,25 +7,46 @@ import unittest
 import json
 import os
 import sys
-from unittest.mock import patch, mock_open
+import tempfile
+import time
 
 # Add the current directory to the path so we can import our module
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from agent_test import AgentTester
+from agent_test import AgentTester, fibonacci, is_prime
 
 class TestAgentTester(unittest.TestCase):
     """Test cases for the AgentTester class."""
     
+    @classmethod
+    def setUpClass(cls):
+        """Build one AgentTester that each test gets a fresh copy of."""
+        cls._prototype = AgentTester()
+    
     def setUp(self):
         """Set up test fixtures before each test method."""
-        self.tester = AgentTester()
+        self.tester = self._prototype.fresh_copy()
     
     def test_initialization(self):
         """Test that AgentTester initializes correctly."""
-        self.assertIsInstance(self.tester.test_results, list)
-        self.assertEqual(len(self.tester.test_results), 0)
-        self.assertIsNotNone(self.tester.start_time)
+        tester = AgentTester()
+        self.assertIsInstance(tester.test_results, list)
+        self.assertEqual(len(tester.test_results), 0)
+        self.assertIsNotNone(tester.start_time)
+    
+    def test_fresh_copy_is_independent(self):
+        """Test that fresh_copy does not share results or output with its source."""
+        self.tester.log_test("Copied", True, "details")
+        clone = self.tester.fresh_copy()
+        
+        self.assertEqual(clone.test_results, [])
+        self.assertEqual(clone._out.getvalue(), "")
+        self.assertIsNot(clone._lock, self.tester._lock)
+        self.assertEqual(clone.start_time, self.tester.start_time)
+        
+        clone.log_test("Clone only", True)
+        self.assertEqual([r.test for r in self.tester.test_results], ["Copied"])
+        self.assertNotIn("Clone only", self.tester._out.getvalue())
     
     def test_log_test_success(self):
         """Test logging a successful test."""
@@ -34,10 +55,10 @@ class TestAgentTester(unittest.TestCase):
         self.assertEqual(len(self.tester.test_results), 1)
         result = self.tester.test_results[0]
         
-        self.assertEqual(result["test"], "Test Case")
-        self.assertTrue(result["success"])
-        self.assertEqual(result["details"], "Success details")
-        self.assertIn("timestamp", result)
+        self.assertEqual(result.test, "Test Case")
+        self.assertTrue(result.success)
+        self.assertEqual(result.details, "Success details")
+        self.assertIn("timestamp", result._fields)
     
     def test_log_test_failure(self):
         """Test logging a failed test."""
@@ -46,9 +67,9 @@ class TestAgentTester(unittest.TestCase):
         self.assertEqual(len(self.tester.test_results), 1)
         result = self.tester.test_results[0]
         
-        self.assertEqual(result["test"], "Test Case")
-        self.assertFalse(result["success"])
-        self.assertEqual(result["details"], "Failure details")
+        self.assertEqual(result.test, "Test Case")
+        self.assertFalse(result.success)
+        self.assertEqual(result.details, "Failure details")
     
     def test_basic_operations(self):
         """Test the basic operations test method."""
@@ -60,27 +81,31 @@ class TestAgentTester(unittest.TestCase):
         
         # Should have passed
         result = self.tester.test_results[-1]
-        self.assertTrue(result["success"])
-        self.assertEqual(result["test"], "Basic Operations")
+        self.assertTrue(result.success)
+        self.assertEqual(result.test, "Basic Operations")
     
-    @patch("builtins.open", new_callable=mock_open, read_data="test content")
-    @patch("os.remove")
-    def test_file_operations(self, mock_remove, mock_file):
+    def test_file_operations(self):
         """Test the file operations test method."""
         initial_count = len(self.tester.test_results)
-        self.tester.test_file_operations()
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            cwd = os.getcwd()
+            os.chdir(tmp_dir)
+            try:
+                self.tester.test_file_operations()
+            finally:
+                os.chdir(cwd)
+            
+            # The temporary file should have been cleaned up
+            self.assertEqual(os.listdir(tmp_dir), [])
         
         # Should have added one test result
         self.assertEqual(len(self.tester.test_results), initial_count + 1)
         
         # Should have passed
         result = self.tester.test_results[-1]
-        self.assertTrue(result["success"])
-        self.assertEqual(result["test"], "File Operations")
-        
-        # Verify file operations were called
-        mock_file.assert_called()
-        mock_remove.assert_called_once()
+        self.assertTrue(result.success)
+        self.assertEqual(result.test, "File Operations")
     
     def test_data_structures(self):
         """Test the data structures test method."""
@@ -92,8 +117,8 @@ class TestAgentTester(unittest.TestCase):
         
         # Should have passed
         result = self.tester.test_results[-1]
-        self.assertTrue(result["success"])
-        self.assertEqual(result["test"], "Data Structures")
+        self.assertTrue(result.success)
+        self.assertEqual(result.test, "Data Structures")
     
     def test_algorithms(self):
         """Test the algorithms test method."""
@@ -105,8 +130,8 @@ class TestAgentTester(unittest.TestCase):
         
         # Should have passed
         result = self.tester.test_results[-1]
-        self.assertTrue(result["success"])
-        self.assertEqual(result["test"], "Algorithms")
+        self.assertTrue(result.success)
+        self.assertEqual(result.test, "Algorithms")
     
     def test_error_handling(self):
         """Test the error handling test method."""
@@ -118,8 +143,35 @@ class TestAgentTester(unittest.TestCase):
         
         # Should have passed
         result = self.tester.test_results[-1]
-        self.assertTrue(result["success"])
-        self.assertEqual(result["test"], "Error Handling")
+        self.assertTrue(result.success)
+        self.assertEqual(result.test, "Error Handling")
+    
+    def test_run_tests_keeps_submission_order(self):
+        """Test that concurrent results are recorded in the order given."""
+        class SlowFirstTester(AgentTester):
+            def test_basic_operations(self):
+                time.sleep(0.05)
+                super().test_basic_operations()
+        
+        tester = SlowFirstTester()
+        tester.run_tests([
+            "test_basic_operations",
+            "test_data_structures",
+            "test_algorithms",
+            "test_error_handling",
+        ])
+        
+        self.assertEqual(
+            [result.test for result in tester.test_results],
+            ["Basic Operations", "Data Structures", "Algorithms", "Error Handling"],
+        )
+        self.assertTrue(tester._out.getvalue().startswith("✅ PASS: Basic Operations\n"))
+    
+    def test_run_tests_empty(self):
+        """Test that running no tests records nothing."""
+        self.tester.run_tests([])
+        self.assertEqual(self.tester.test_results, [])
+        self.assertEqual(self.tester._out.getvalue(), "")
     
     def test_generate_report(self):
         """Test report generation."""
@@ -144,6 +196,57 @@ class TestAgentTester(unittest.TestCase):
         self.assertEqual(report["failed"], 1)
         self.assertAlmostEqual(report["success_rate"], 66.7, places=1)
 
+class TestAlgorithmKernels(unittest.TestCase):
+    """Test the module-level algorithm kernels against simple references."""
+    
+    @staticmethod
+    def reference_fibonacci(n):
+        """Iterative Fibonacci used as the reference."""
+        a, b = 0, 1
+        for _ in range(n):
+            a, b = b, a + b
+        return a
+    
+    def test_fibonacci_small_values(self):
+        """Test the base cases and the first values of the sequence."""
+        self.assertEqual(fibonacci(0), 0)
+        self.assertEqual(fibonacci(1), 1)
+        self.assertEqual(fibonacci(2), 1)
+        self.assertEqual([fibonacci(n) for n in range(11)],
+                         [0, 1, 1, 2, 3, 5, 8, 13, 21, 34, 55])
+    
+    def test_fibonacci_powers_of_two(self):
+        """Test n = 2**k, where only the leading bit of n is set."""
+        for k in range(11):
+            n = 2 ** k
+            self.assertEqual(fibonacci(n), self.reference_fibonacci(n), f"fibonacci({n})")
+    
+    def test_fibonacci_large_n(self):
+        """Test values well past the 64-bit range."""
+        for n in list(range(300)) + [1000]:
+            self.assertEqual(fibonacci(n), self.reference_fibonacci(n), f"fibonacci({n})")
+        self.assertEqual(fibonacci(200), 280571172992510140037611932413038677189525)
+    
+    def test_is_prime_matches_trial_division(self):
+        """Test is_prime across the small-prime mask and the 6k+/-1 wheel."""
+        def reference(n):
+            return n >= 2 and all(n % i for i in range(2, int(n ** 0.5) + 1))
+        
+        for n in range(-5, 5000):
+            self.assertEqual(is_prime(n), reference(n), f"is_prime({n})")
+    
+    def test_is_prime_mask_boundary(self):
+        """Test the values either side of the 64-bit mask cutoff."""
+        self.assertFalse(is_prime(63))
+        self.assertFalse(is_prime(64))
+        self.assertFalse(is_prime(65))
+        self.assertTrue(is_prime(61))
+        self.assertTrue(is_prime(67))
+        # Squares of wheel candidates exercise the i * i <= n bound
+        self.assertFalse(is_prime(11 * 11))
+        self.assertFalse(is_prime(13 * 13))
+        self.assertFalse(is_prime(17 * 17))
+
 class TestMathOperations(unittest.TestCase):
     """Test basic mathematical operations."""
     
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the dashboard HTTP server
+"""
+
+import unittest
+import contextlib
+import errno
+import functools
+import gzip
+import http.client
+import io
+import os
+import sys
+import tempfile
+import threading
+from unittest.mock import patch
+
+# Add the current directory to the path so we can import our module
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from server import (CustomHTTPRequestHandler, DashboardHTTPServer,
+                    accepts_gzip, etag_matches, start_server)
+
+class QuietHTTPRequestHandler(CustomHTTPRequestHandler):
+    """Request handler that does not log each request to stderr."""
+
+    def log_message(self, format, *args):
+        pass
+
+class TestCachedResponses(unittest.TestCase):
+    """Test the cached, gzip-aware static responses."""
+
+    CONTENT = b'{"status": "ok", "items": [1, 2, 3]}\n' * 20
+
+    def setUp(self):
+        """Serve a temporary directory on an ephemeral port."""
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "report.json")
+        with open(self.path, "wb") as f:
+            f.write(self.CONTENT)
+
+        handler = functools.partial(QuietHTTPRequestHandler,
+                                    directory=self.tmp_dir.name)
+        self.httpd = DashboardHTTPServer(("127.0.0.1", 0), handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        """Stop the server and remove the temporary directory."""
+        self.httpd.shutdown()
+        self.thread.join()
+        self.httpd.server_close()
+        self.tmp_dir.cleanup()
+
+    def request(self, headers=None):
+        """GET /report.json and return (response, body)."""
+        conn = http.client.HTTPConnection("127.0.0.1", self.httpd.server_port)
+        try:
+            conn.request("GET", "/report.json", headers=headers or {})
+            response = conn.getresponse()
+            return response, response.read()
+        finally:
+            conn.close()
+
+    def test_plain_body(self):
+        """Test that clients without gzip get the raw file."""
+        response, body = self.request()
+        self.assertEqual(response.status, 200)
+        self.assertIsNone(response.getheader("Content-Encoding"))
+        self.assertEqual(body, self.CONTENT)
+
+    def test_gzip_body(self):
+        """Test that gzip clients get a body that decompresses to the file."""
+        response, body = self.request({"Accept-Encoding": "gzip, deflate"})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.getheader("Content-Encoding"), "gzip")
+        self.assertEqual(int(response.getheader("Content-Length")), len(body))
+        self.assertEqual(gzip.decompress(body), self.CONTENT)
+
+    def test_gzip_refused_with_zero_q(self):
+        """Test that gzip;q=0 gets the identity encoding."""
+        response, body = self.request({"Accept-Encoding": "gzip;q=0"})
+        self.assertIsNone(response.getheader("Content-Encoding"))
+        self.assertEqual(body, self.CONTENT)
+
+    def test_matching_etag_returns_304(self):
+        """Test that a matching If-None-Match gets a 304 with no body."""
+        for headers in ({}, {"Accept-Encoding": "gzip"}):
+            etag = self.request(headers)[0].getheader("ETag")
+            response, body = self.request(dict(headers, **{"If-None-Match": etag}))
+            self.assertEqual(response.status, 304)
+            self.assertEqual(response.getheader("ETag"), etag)
+            self.assertEqual(body, b"")
+
+    def test_weak_etag_returns_304(self):
+        """Test that If-None-Match uses weak comparison."""
+        etag = self.request()[0].getheader("ETag")
+        response, body = self.request({"If-None-Match": f'"other", W/{etag}'})
+        self.assertEqual(response.status, 304)
+        self.assertEqual(body, b"")
+
+    def test_other_encoding_etag_returns_200(self):
+        """Test that the gzip ETag does not validate the plain response."""
+        gzip_etag = self.request({"Accept-Encoding": "gzip"})[0].getheader("ETag")
+        plain_etag = self.request()[0].getheader("ETag")
+        self.assertNotEqual(gzip_etag, plain_etag)
+
+        response, body = self.request({"If-None-Match": gzip_etag})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(body, self.CONTENT)
+
+    def test_if_modified_since_returns_304(self):
+        """Test date-only revalidation for plain and gzip requests."""
+        for headers in ({}, {"Accept-Encoding": "gzip"}):
+            first = self.request(headers)[0]
+            last_modified = first.getheader("Last-Modified")
+            response, body = self.request(dict(headers, **{"If-Modified-Since": last_modified}))
+            self.assertEqual(response.status, 304)
+            self.assertEqual(response.getheader("ETag"), first.getheader("ETag"))
+            self.assertEqual(response.getheader("Vary"), "Accept-Encoding")
+            self.assertEqual(body, b"")
+
+    def test_if_modified_since_older_returns_200(self):
+        """Test that a date before the file's mtime gets the full body."""
+        response, body = self.request({"If-Modified-Since": "Thu, 01 Jan 1970 00:00:00 GMT"})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(body, self.CONTENT)
+
+    def test_if_none_match_overrides_if_modified_since(self):
+        """Test that If-Modified-Since is ignored when If-None-Match is present."""
+        response, body = self.request({
+            "If-None-Match": '"stale"',
+            "If-Modified-Since": "Wed, 01 Jan 2031 00:00:00 GMT",
+        })
+        self.assertEqual(response.status, 200)
+        self.assertEqual(body, self.CONTENT)
+
+    def test_modified_file_invalidates_cache(self):
+        """Test that changing the file on disk refreshes the cached copy."""
+        old_etag = self.request()[0].getheader("ETag")
+
+        new_content = b'{"status": "changed"}\n'
+        with open(self.path, "wb") as f:
+            f.write(new_content)
+        st = os.stat(self.path)
+        os.utime(self.path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        response, body = self.request({"If-None-Match": old_etag})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(body, new_content)
+        self.assertNotEqual(response.getheader("ETag"), old_etag)
+
+class TestHeaderParsing(unittest.TestCase):
+    """Test the Accept-Encoding and If-None-Match helpers."""
+
+    def test_accepts_gzip(self):
+        """Test q-value handling in Accept-Encoding."""
+        self.assertTrue(accepts_gzip("gzip"))
+        self.assertTrue(accepts_gzip("br, gzip;q=0.5"))
+        self.assertTrue(accepts_gzip("*"))
+        self.assertFalse(accepts_gzip(""))
+        self.assertFalse(accepts_gzip("gzip;q=0"))
+        self.assertFalse(accepts_gzip("gzip; q=0.0, br"))
+        self.assertFalse(accepts_gzip("*, gzip;q=0"))
+        self.assertFalse(accepts_gzip("identity"))
+
+    def test_etag_matches(self):
+        """Test weak comparison of entity tags."""
+        self.assertTrue(etag_matches('"abc"', '"abc"'))
+        self.assertTrue(etag_matches('W/"abc"', '"abc"'))
+        self.assertTrue(etag_matches('"x", "abc"', '"abc"'))
+        self.assertTrue(etag_matches("*", '"abc"'))
+        self.assertFalse(etag_matches('"abc-gzip"', '"abc"'))
+
+class TestStartServer(unittest.TestCase):
+    """Test the port scan in start_server."""
+
+    def setUp(self):
+        cwd = os.getcwd()
+        self.addCleanup(os.chdir, cwd)
+
+    def test_port_scan_stops_at_65535(self):
+        """Test that the scan never tries ports past 65535."""
+        tried = []
+
+        def busy(address, handler):
+            tried.append(address[1])
+            raise OSError(errno.EADDRINUSE, "Address already in use")
+
+        output = io.StringIO()
+        with patch("server.DashboardHTTPServer", side_effect=busy), \
+                contextlib.redirect_stdout(output):
+            with self.assertRaises(SystemExit):
+                start_server(65530)
+
+        self.assertEqual(tried, list(range(65530, 65536)))
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[-2], "❌ Port 65535 is already in use.")
+        self.assertEqual(lines[-1], "❌ No free port in range 65530-65535")
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)